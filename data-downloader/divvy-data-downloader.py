@@ -5,164 +5,508 @@ A straightforward script to download Divvy bike trip data from:
 https://divvy-tripdata.s3.amazonaws.com/index.html
 
 Features:
-- File discovery via URL pattern testing
+- File discovery via the S3 bucket listing
 - Year and quarter filtering
-- Progress tracking during downloads
-- Skips already downloaded files
+- Concurrent downloads with an overall progress bar
+- Skips already downloaded files (tracked by ETag) and resumes partial ones
+- Caches the bucket listing for a day between runs
 
 Python 3.9.12 compatible
 """
 
 import os
 import re
+import sys
+import json
+import time
 import argparse
+import threading
 import requests
+import xml.etree.ElementTree as ET
+from dataclasses import asdict, dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin
 from tqdm import tqdm
 
+# XML namespace used by S3 ListObjectsV2 responses
+S3_NS = "{http://s3.amazonaws.com/doc/2006-03-01/}"
 
-def get_available_files(base_url):
+# Monthly data files, e.g. 202301-divvy-tripdata.zip
+MONTHLY_FILE_RE = re.compile(r"^(\d{4})(0[1-9]|1[0-2])-divvy-tripdata\.zip$")
+
+# Quarter of each month, indexed by month number (index 0 unused)
+MONTH_TO_QUARTER = (0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4)
+
+# Sidecar in the output directory recording the ETag of each downloaded file
+DOWNLOAD_INDEX_NAME = ".divvy-index.json"
+
+# Bytes per megabyte, used for size reporting
+MB = 1024 * 1024
+
+# Read size used when streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = MB
+
+# (connect, read) timeouts in seconds for download requests, so a stalled
+# connection fails instead of blocking a worker (and Ctrl-C) indefinitely
+DOWNLOAD_TIMEOUT = (10, 60)
+
+# Bytes received between progress bar updates
+PROGRESS_UPDATE_SIZE = 16 * MB
+
+# Bytes received between crash-recovery checkpoints of a partial download.
+# Each checkpoint fsyncs the data, so keep this well above the progress cadence.
+CHECKPOINT_SIZE = 256 * MB
+
+# Write buffer for downloaded files, coalescing several chunks per write()
+WRITE_BUFFER_SIZE = 4 * MB
+
+# How long a cached bucket listing stays valid, in seconds
+INDEX_CACHE_TTL = 24 * 60 * 60
+
+# Maximum number of pooled connections per host
+MAX_CONNECTIONS = 32
+
+# Progress bar options: refresh at most twice a second, and not at all
+# when stderr (where tqdm draws) is redirected to a file or pipe
+PROGRESS_OPTIONS = {
+    "unit": "B",
+    "unit_scale": True,
+    "unit_divisor": 1024,
+    "mininterval": 0.5,
+    "disable": not sys.stderr.isatty(),
+}
+
+
+@dataclass(frozen=True)
+class FileInfo:
+    """A downloadable data file discovered in the bucket."""
+    
+    # Declared by hand because dataclass(slots=True) needs Python 3.10+
+    __slots__ = ("filename", "url", "size", "size_mb", "year", "month", "etag")
+    
+    filename: str
+    url: str
+    size: int
+    size_mb: float
+    year: int
+    month: int
+    etag: str
+
+
+# One session shared by discovery and all download threads, so connections
+# (and their TLS handshakes) are reused and transient S3 errors are retried
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=MAX_CONNECTIONS,
+    pool_maxsize=MAX_CONNECTIONS,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"])
+    )
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+# Guards updates to a progress bar shared between download threads
+_progress_lock = threading.Lock()
+
+# Set on Ctrl-C so in-flight downloads stop and leave their .part files resumable
+_stop_event = threading.Event()
+
+
+def get_index_cache_path():
+    """Return the path of the cached bucket listing, honouring XDG_CACHE_HOME."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "divvy_downloader", "index.json")
+
+
+def load_cached_index(base_url):
+    """
+    Load a previously saved file listing if it is fresh and for the same URL.
+    
+    Args:
+        base_url: Base URL of the Divvy data repository
+        
+    Returns:
+        List of FileInfo objects, or None if no usable cache exists
+    """
+    cache_path = get_index_cache_path()
+    try:
+        if time.time() - os.path.getmtime(cache_path) > INDEX_CACHE_TTL:
+            return None
+        with open(cache_path) as f:
+            cache = json.load(f)
+        if cache.get("base_url") != base_url:
+            return None
+        return [FileInfo(**file) for file in cache["files"]]
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+
+def save_cached_index(base_url, files):
+    """
+    Save the file listing so repeat runs can skip discovery.
+    
+    Args:
+        base_url: Base URL of the Divvy data repository
+        files: List of FileInfo objects
+    """
+    cache_path = get_index_cache_path()
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump({"base_url": base_url, "files": [asdict(file) for file in files]}, f)
+    except OSError as e:
+        print(f"Could not write index cache {cache_path}: {str(e)}")
+
+
+def get_available_files(base_url, refresh=False):
     """
-    Discover available Divvy data files using pattern-based URL testing.
+    Discover available Divvy data files from the S3 bucket listing.
+    
+    A listing cached within the last INDEX_CACHE_TTL seconds is reused
+    unless refresh is set.
     
     Args:
         base_url: Base URL of the Divvy data repository
+        refresh: Ignore the cached listing and query the bucket again
         
     Returns:
-        List of dictionaries containing file information
+        List of FileInfo objects sorted by year and month
     """
-    session = requests.Session()
+    if not refresh:
+        cached_files = load_cached_index(base_url)
+        if cached_files:
+            print(f"Using cached file index from {get_index_cache_path()}")
+            return cached_files
+    
     discovered_files = []
+    complete = False
     
     print("Discovering available files...")
     
-    # Test for monthly files (most common format)
-    for year in range(2013, 2025):
-        for month in range(1, 13):
-            filename = f"{year}{month:02d}-divvy-tripdata.zip"
-            url = urljoin(base_url, filename)
+    params = {"list-type": "2"}
+    while True:
+        try:
+            response = _session.get(base_url, params=params, timeout=30)
+            response.raise_for_status()
+            root = ET.fromstring(response.content)
+        except (requests.exceptions.RequestException, ET.ParseError) as e:
+            print(f"Error listing {base_url}: {str(e)}")
+            break
+        
+        for contents in root.iter(f"{S3_NS}Contents"):
+            filename = contents.findtext(f"{S3_NS}Key", "")
+            match = MONTHLY_FILE_RE.match(filename)
+            if not match:
+                continue
             
             try:
-                # Make a HEAD request to check if file exists
-                head_response = session.head(url, timeout=5)
-                if head_response.status_code == 200:
-                    # File exists
-                    content_length = head_response.headers.get('Content-Length', '0')
-                    size = int(content_length) if content_length.isdigit() else 0
-                    size_mb = round(size / (1024 * 1024), 2)
-                    
-                    discovered_files.append({
-                        "filename": filename,
-                        "url": url,
-                        "size": size,
-                        "size_mb": size_mb,
-                        "year": year,
-                        "month": month
-                    })
-                    print(f"Found file: {filename} ({size_mb} MB)")
-            except requests.exceptions.RequestException:
-                # File doesn't exist or connection error - skip silently
-                pass
+                size = int(contents.findtext(f"{S3_NS}Size", 0))
+            except (TypeError, ValueError):
+                size = 0
+            size_mb = round(size / MB, 2)
+            
+            discovered_files.append(FileInfo(
+                filename=filename,
+                url=urljoin(base_url, filename),
+                size=size,
+                size_mb=size_mb,
+                year=int(match.group(1)),
+                month=int(match.group(2)),
+                etag=contents.findtext(f"{S3_NS}ETag", "")
+            ))
+            print(f"Found file: {filename} ({size_mb} MB)")
+        
+        # Listings are paginated at 1000 keys per response
+        if root.findtext(f"{S3_NS}IsTruncated") != "true":
+            complete = True
+            break
+        token = root.findtext(f"{S3_NS}NextContinuationToken")
+        if not token:
+            # Without a token the next request would refetch the first page forever
+            print(f"Error listing {base_url}: truncated listing without a continuation token")
+            break
+        params["continuation-token"] = token
     
     # Sort files by year and month
-    discovered_files.sort(key=lambda x: (x["year"], x["month"]))
+    discovered_files.sort(key=lambda x: (x.year, x.month))
+    
+    # Only cache complete listings so a failed page is retried next run
+    if complete and discovered_files:
+        save_cached_index(base_url, discovered_files)
     return discovered_files
 
 
-def filter_files_by_year(files, year):
+def load_download_index(output_dir):
     """
-    Filter files list to include only those from the specified year.
+    Load the ETags of previously downloaded files.
     
     Args:
-        files: List of file dictionaries
-        year: Year to filter by (as integer)
+        output_dir: Directory containing the downloaded files
         
     Returns:
-        Filtered list of files
+        Dictionary mapping filename to ETag (empty if no index exists)
     """
-    if not year:
-        return files
-        
-    return [file for file in files if file["year"] == year]
+    try:
+        with open(os.path.join(output_dir, DOWNLOAD_INDEX_NAME)) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def save_download_index(output_dir, index):
+    """
+    Save the ETags of downloaded files next to them.
+    
+    Args:
+        output_dir: Directory containing the downloaded files
+        index: Dictionary mapping filename to ETag
+    """
+    index_path = os.path.join(output_dir, DOWNLOAD_INDEX_NAME)
+    try:
+        with open(index_path, "w") as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+    except OSError as e:
+        print(f"Could not write download index {index_path}: {str(e)}")
 
 
-def filter_files_by_quarter(files, year, quarter):
+def filter_files(files, year=None, quarter=None):
     """
-    Filter files list to include only those from the specified year and quarter.
+    Filter files list to include only those from the specified year and/or quarter.
     
     Args:
-        files: List of file dictionaries
-        year: Year to filter by (as integer)
-        quarter: Quarter to filter by (1-4)
+        files: List of FileInfo objects
+        year: Year to filter by (as integer), or None for all years
+        quarter: Quarter to filter by (1-4), or None for all quarters
         
     Returns:
         Filtered list of files
     """
-    if not year or not quarter:
-        return files
-        
-    if quarter not in [1, 2, 3, 4]:
+    if quarter and quarter not in (1, 2, 3, 4):
         raise ValueError("Quarter must be 1, 2, 3, or 4")
     
-    # Define month ranges for each quarter
-    quarter_months = {
-        1: [1, 2, 3],
-        2: [4, 5, 6],
-        3: [7, 8, 9],
-        4: [10, 11, 12]
-    }
-    
     return [
-        file for file in files 
-        if file["year"] == year and file["month"] in quarter_months[quarter]
+        file for file in files
+        if (not year or file.year == year)
+        and (not quarter or MONTH_TO_QUARTER[file.month] == quarter)
     ]
 
 
-def download_file(url, output_path, session=None):
+def preallocate(f, size):
+    """
+    Reserve disk space for a file up front so it is laid out contiguously.
+    
+    Args:
+        f: Open file object
+        size: Total file size in bytes
+    """
+    if size <= 0 or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(f.fileno(), 0, size)
+    except OSError:
+        # Not supported by every filesystem - writing still works without it
+        pass
+
+
+def read_part_progress(part_path):
+    """
+    Read how many bytes of a partial download are known to be on disk.
+    
+    Args:
+        part_path: Path of the partial download
+        
+    Returns:
+        Number of bytes received, or None if no progress was recorded
+    """
+    try:
+        with open(part_path + ".progress") as f:
+            return int(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        # Unreadable record - safest to start over
+        return 0
+
+
+def write_part_progress(part_path, size):
+    """
+    Record how many bytes of a partial download are on disk.
+    
+    Preallocated .part files are full-size from the start, so after a hard
+    kill their size says nothing about how much was received; this record
+    is what a later run resumes from. The caller must fsync the data first.
+    
+    Args:
+        part_path: Path of the partial download
+        size: Number of bytes received
+    """
+    progress_path = part_path + ".progress"
+    with open(progress_path + ".tmp", "w") as f:
+        f.write(str(size))
+    os.replace(progress_path + ".tmp", progress_path)
+
+
+def finish_part(part_path, output_path):
+    """
+    Move a completed partial download into place and drop its progress record.
+    
+    Args:
+        part_path: Path of the completed partial download
+        output_path: Final path of the file
+    """
+    os.replace(part_path, output_path)
+    try:
+        os.remove(part_path + ".progress")
+    except FileNotFoundError:
+        pass
+
+
+def download_file(url, output_path, session=None, pbar=None, etag=None, size=None):
     """
     Download a single file with progress tracking.
     
+    Data is written to "<output_path>.part" and renamed to output_path once
+    complete. If a partial file already exists, the download resumes from
+    the byte count recorded next to it (or its size if none was recorded)
+    using an HTTP Range request. If etag is given the request is made
+    conditional on it, so a file that changed on the server is downloaded
+    again in full. Partial files are kept on failure so a later run can
+    resume them.
+    
     Args:
         url: URL of the file to download
-        output_path: Local path to save the file
-        session: Requests session (creates new one if None)
+        output_path: Local path to save the file; its directory must exist
+        session: Requests session (uses the shared module session if None)
+        pbar: Shared progress bar to update (creates a per-file one if None)
+        etag: Expected ETag of the remote file, used to validate a resume
+        size: Expected size of the remote file; a partial file that already
+            has this many bytes is moved into place without a request
         
     Returns:
         True if download successful, False otherwise
     """
     if session is None:
-        session = requests.Session()
+        session = _session
     
+    part_path = output_path + ".part"
+    resume = 0
+    reported_resume = 0
+    written = 0
+    unreported = 0
+    unsaved = 0
     try:
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        # Ask only for the missing bytes of a partial download
+        if os.path.exists(part_path):
+            resume = os.path.getsize(part_path)
+            recorded = read_part_progress(part_path)
+            if recorded is not None:
+                resume = min(resume, recorded)
         
-        # Download with progress bar
-        response = session.get(url, stream=True)
-        response.raise_for_status()
+        # tqdm.write keeps log lines from breaking the progress bar
+        name = os.path.basename(output_path)
         
-        # Get total file size for progress bar
-        total_size = int(response.headers.get('Content-Length', 0))
+        # Completed last time but interrupted before the rename
+        if size and resume == size:
+            with open(part_path, 'r+b') as f:
+                f.truncate(size)
+            finish_part(part_path, output_path)
+            if pbar is not None:
+                with _progress_lock:
+                    pbar.update(size)
+            tqdm.write(f"Downloaded {name} (completed from partial file)")
+            return True
         
-        with open(output_path, 'wb') as f, tqdm(
-            desc=os.path.basename(output_path),
-            total=total_size,
-            unit='B',
-            unit_scale=True,
-            unit_divisor=1024
-        ) as pbar:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-                    pbar.update(len(chunk))
+        headers = {}
+        if resume:
+            headers["Range"] = f"bytes={resume}-"
+            if etag:
+                headers["If-Range"] = etag
+        response = session.get(url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT)
+        
+        # Local file is not a prefix of the remote one - start over
+        if response.status_code == 416:
+            response.close()
+            response = session.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT)
+        with response:
+            response.raise_for_status()
+            
+            # Servers that ignore Range (or a failed If-Range) send the whole file with a 200
+            if response.status_code != 206:
+                resume = 0
+            
+            # Get total file size for progress bar
+            total_size = resume + int(response.headers.get('Content-Length', 0))
+            
+            file_pbar = pbar if pbar is not None else tqdm(
+                desc=name,
+                total=total_size,
+                initial=resume,
+                **PROGRESS_OPTIONS
+            )
+            if pbar is not None and resume:
+                with _progress_lock:
+                    pbar.update(resume)
+                reported_resume = resume
+            
+            if resume:
+                tqdm.write(f"Resuming {name} at {resume / MB:.2f} of {total_size / MB:.2f} MB")
+            else:
+                tqdm.write(f"Downloading {name} ({total_size / MB:.2f} MB)")
+            try:
+                with open(part_path, 'r+b' if resume else 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                    f.seek(resume)
+                    # Record progress before preallocating makes the file full-size
+                    write_part_progress(part_path, resume)
+                    preallocate(f, total_size)
+                    try:
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            if _stop_event.is_set():
+                                raise RuntimeError("Download cancelled")
+                            if chunk:
+                                f.write(chunk)
+                                written += len(chunk)
+                                unreported += len(chunk)
+                                unsaved += len(chunk)
+                                if unreported >= PROGRESS_UPDATE_SIZE:
+                                    with _progress_lock:
+                                        file_pbar.update(unreported)
+                                    unreported = 0
+                                if unsaved >= CHECKPOINT_SIZE:
+                                    # Checkpoint so a hard kill can resume from here
+                                    f.flush()
+                                    os.fsync(f.fileno())
+                                    write_part_progress(part_path, resume + written)
+                                    unsaved = 0
+                    finally:
+                        # Drop any preallocated space past the data actually received
+                        f.truncate()
+                        os.fsync(f.fileno())
+                        write_part_progress(part_path, resume + written)
+            finally:
+                if unreported:
+                    with _progress_lock:
+                        file_pbar.update(unreported)
+                if pbar is None:
+                    file_pbar.close()
         
+        finish_part(part_path, output_path)
+        tqdm.write(f"Downloaded {name}")
         return True
     
     except Exception as e:
-        print(f"Error downloading {url}: {str(e)}")
-        # Remove partial file if download failed
-        if os.path.exists(output_path):
-            os.remove(output_path)
+        if not _stop_event.is_set():
+            tqdm.write(f"Error downloading {url}: {str(e)}")
+        # Take the failed bytes back out of the shared progress total
+        if pbar is not None and (reported_resume or written):
+            with _progress_lock:
+                pbar.update(-(reported_resume + written))
         return False
 
 
@@ -200,13 +544,24 @@ def main():
         action="store_true",
         help="Only list available files without downloading"
     )
+    parser.add_argument(
+        "--refresh-index",
+        action="store_true",
+        help="Ignore the cached file index and query the bucket again"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help=f"Number of files to download concurrently (max {MAX_CONNECTIONS})"
+    )
     args = parser.parse_args()
     
     # Create output directory
     os.makedirs(args.output_dir, exist_ok=True)
     
     # Get available files
-    all_files = get_available_files(args.url)
+    all_files = get_available_files(args.url, refresh=args.refresh_index)
     if not all_files:
         print("No files found. Please check the URL.")
         return
@@ -214,48 +569,103 @@ def main():
     print(f"Found {len(all_files)} files in total")
     
     # Apply filters if specified
-    filtered_files = all_files
+    filtered_files = filter_files(all_files, args.year, args.quarter)
+    period = []
     if args.year:
-        filtered_files = filter_files_by_year(filtered_files, args.year)
-        print(f"Filtered by year {args.year}: {len(filtered_files)} files")
-    
-    if args.year and args.quarter:
-        filtered_files = filter_files_by_quarter(filtered_files, args.year, args.quarter)
-        print(f"Filtered by {args.year} Q{args.quarter}: {len(filtered_files)} files")
+        period.append(str(args.year))
+    if args.quarter:
+        period.append(f"Q{args.quarter}")
+    if period:
+        print(f"Filtered by {' '.join(period)}: {len(filtered_files)} files")
     
     if not filtered_files:
         print("No files match the specified filters.")
         return
     
     # Calculate total download size
-    total_size_mb = sum(file["size_mb"] for file in filtered_files)
+    total_size_mb = sum(file.size_mb for file in filtered_files)
     print(f"Total download size: {total_size_mb:.2f} MB")
     
     # List mode - just show files and exit
     if args.list_only:
         print("\nAvailable files:")
         for file in filtered_files:
-            print(f"{file['filename']} - {file['size_mb']} MB")
+            print(f"{file.filename} - {file.size_mb} MB")
         return
     
-    # Download files one by one
-    print(f"\nDownloading {len(filtered_files)} files to {args.output_dir}")
-    session = requests.Session()
-    
+    # Skip files already downloaded. A file recorded in the ETag index only
+    # needs to exist; a size check is the fallback for files it lacks.
+    downloaded = load_download_index(args.output_dir)
     successful_downloads = 0
+    pending_files = []
     for file in filtered_files:
-        output_path = os.path.join(args.output_dir, file["filename"])
+        output_path = os.path.join(args.output_dir, file.filename)
+        if file.filename in downloaded and not os.path.exists(output_path):
+            # Deleted or moved since it was downloaded - forget it
+            del downloaded[file.filename]
         
-        # Skip if file already exists with correct size
-        if os.path.exists(output_path):
-            if os.path.getsize(output_path) == file["size"]:
-                print(f"Skipping {file['filename']} (already downloaded)")
-                successful_downloads += 1
-                continue
+        if file.etag and downloaded.get(file.filename) == file.etag:
+            already_downloaded = True
+        elif file.filename not in downloaded or not file.etag:
+            already_downloaded = (
+                os.path.exists(output_path) and os.path.getsize(output_path) == file.size
+            )
+            if already_downloaded:
+                downloaded[file.filename] = file.etag
+        else:
+            # Recorded ETag differs - the file changed on the server
+            already_downloaded = False
         
-        print(f"Downloading {file['filename']} ({file['size_mb']} MB)")
-        if download_file(file["url"], output_path, session):
+        if already_downloaded:
+            print(f"Skipping {file.filename} (already downloaded)")
             successful_downloads += 1
+        else:
+            pending_files.append(file)
+    save_download_index(args.output_dir, downloaded)
+    
+    if not pending_files:
+        print(f"\nAll {len(filtered_files)} files already downloaded to {os.path.abspath(args.output_dir)}")
+        return
+    
+    # Download remaining files concurrently
+    # More workers than pooled connections would just churn connections
+    workers = max(1, min(args.workers, MAX_CONNECTIONS))
+    print(f"\nDownloading {len(pending_files)} files to {args.output_dir} ({workers} at a time)")
+    
+    with tqdm(
+        desc="Total",
+        total=sum(file.size for file in pending_files),
+        **PROGRESS_OPTIONS
+    ) as pbar:
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = {
+            executor.submit(
+                download_file,
+                file.url,
+                os.path.join(args.output_dir, file.filename),
+                _session,
+                pbar,
+                file.etag,
+                file.size
+            ): file
+            for file in pending_files
+        }
+        try:
+            for future in as_completed(futures):
+                if future.result():
+                    successful_downloads += 1
+                    file = futures[future]
+                    downloaded[file.filename] = file.etag
+                    save_download_index(args.output_dir, downloaded)
+        except KeyboardInterrupt:
+            # Drop queued downloads and tell running ones to stop after their
+            # current chunk instead of waiting for the whole batch
+            _stop_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            tqdm.write(f"\nInterrupted: {successful_downloads} of {len(filtered_files)} files downloaded")
+            tqdm.write("Rerun the script to resume the remaining files")
+            sys.exit(130)
+        executor.shutdown()
     
     # Print summary
     print(f"\nDownload complete: {successful_downloads} of {len(filtered_files)} files downloaded")